@@ -2,7 +2,22 @@
 import re
 import os
 import sys
-import copy
+import functools
+import csv
+import bisect
+import pickle
+import mmap
+import concurrent.futures
+from array import array
+# numpy/numba are optional, only used to speed up merging of large init sequences
+try:
+    import numpy as np
+except ImportError:
+    np = None
+try:
+    import numba
+except ImportError:
+    numba = None
 
 # BaseRegister -> Entry -> Field
 # Example: 
@@ -18,8 +33,12 @@ import copy
 # Provides a zynq7_allregisters global variable
 
 class Entry:
+    __slots__ = ('name', '_name_lc', 'addr', 'width', 'tp', 'reset', 'description', 'fields')
+
     def __init__(self, name, addr, width, tp, reset, description):
-        self.name = name
+        # interned names hash/compare via the identity fast path in dict lookups
+        self.name = sys.intern(name)
+        self._name_lc = sys.intern(name.lower()) # names never change, lowercase them once
         self.addr = addr
         self.width = width
         self.tp = tp
@@ -27,12 +46,6 @@ class Entry:
         self.description = description
         self.fields = {}
 
-    def name(self):
-        return self.name
-
-    def addr(self):
-        return self.addr
-
     def add_field(self, field, mask):
         self.fields[field.upper()] = mask
 
@@ -49,12 +62,26 @@ class Entry:
 
 
 class BaseRegister:
+    __slots__ = ('name', '_name_lc', 'baseaddrs', 'entries', 'basemask', 'highaddr',
+                 '_by_name', '_by_offset', '_baseaddr_set',
+                 '_sorted_offs', '_sorted_entries')
+
     def __init__(self, baseaddrs, entries, name="", basemask=0xFFFFF000, highaddr='default'):
         self.name = name
+        self._name_lc = name.lower()
         self.baseaddrs = baseaddrs
         self.entries = entries
         self.basemask = basemask
         self.highaddr = basemask^0xFFFFFFFF if highaddr=='default' else highaddr
+        # hot path lookup tables, entry names/offsets never change after init
+        self._by_name = {e._name_lc: e for e in entries}
+        self._by_offset = {e.addr: e for e in entries}
+        self._baseaddr_set = frozenset(baseaddrs)
+        # sorted views so a2e can bisect for the enclosing entry on exact miss;
+        # offsets live in a packed uint32 column so the bisect walks contiguous
+        # memory instead of chasing Entry pointers
+        self._sorted_offs = array('I', sorted(e.addr for e in entries))
+        self._sorted_entries = [self._by_offset[o] for o in self._sorted_offs]
 
     def update_entry_field(self, entryaddr, fieldname, fieldmask):
         e = self.a2e(entryaddr)
@@ -64,37 +91,44 @@ class BaseRegister:
         return False
 
     def abelong(self, addr):
-        for baddr in self.baseaddrs:
-            if baddr == addr & self.basemask:
-                return True
-        return False
+        return (addr & self.basemask) in self._baseaddr_set
 
     def n2e(self, entry):
-        for e in self.entries:
-            if e.name.lower() == entry.lower():
-                return e
-        print("Entry", entry, "not found in BaseRegister", self.name, "!")
-        return None
+        e = self._by_name.get(entry.lower())
+        if e is None:
+            print("Entry", entry, "not found in BaseRegister", self.name, "!")
+        return e
 
     def a2e(self, addr):
         if not self.abelong(addr):
             return None
-        for e in self.entries:
-            for baddr in self.baseaddrs:
-                if e.addr + baddr == addr:
-                    return e
-        print(hex(addr), ' not found in BaseRegister ', self.name, '!')
-        return None
+        # abelong passed, so the matched base is just the masked address
+        off = addr - (addr & self.basemask)
+        e = self._by_offset.get(off)
+        if e is None:
+            # maybe a write inside a register rather than at its own offset
+            e = self.a2e_containing(addr)
+        if e is None:
+            print(hex(addr), ' not found in BaseRegister ', self.name, '!')
+        return e
         # raise Exception("Entry ", hex(addr), " not found in Register ", self.name, " !")
 
+    # the entry whose (32-bit) register contains addr, or None
+    def a2e_containing(self, addr):
+        off = addr - (addr & self.basemask)
+        i = bisect.bisect_right(self._sorted_offs, off) - 1
+        if i < 0:
+            return None
+        e = self._sorted_entries[i]
+        if off >= e.addr + 4:
+            return None
+        return e
+
     def a2n(self, addr):
-        name = ''
-        for e in self.entries:
-            if e.addr == addr:
-                name = e.name()
-        if name == '':
+        e = self._by_offset.get(addr)
+        if e is None:
             raise Exception("Entry ", hex(addr), " not found in BaseRegister ", self.name, "!")
-        return name
+        return e.name
     
     def show(self):
         if len(self.baseaddrs) > 1:
@@ -111,24 +145,126 @@ class Zynq7_AllRegisters:
     def __init__(self, baseregisters):
         self.inited = False
         self.baseregisters = baseregisters
+        # dispatch tables: masked address -> BaseRegister, one table per distinct basemask
+        # (all ZYNQ BaseRegisters share 0xFFFFF000, so normally a single table)
+        masks = {}
+        for br in baseregisters:
+            tbl = masks.setdefault(br.basemask, {})
+            for baddr in br.baseaddrs:
+                tbl[baddr] = br
+        self._mask_tables = list(masks.items())
+        # every ZYNQ BaseRegister uses basemask 0xFFFFF000, so normally there is
+        # a single table and insert can skip the loop entirely
+        if len(self._mask_tables) == 1:
+            self._fast_mask, self._fast = self._mask_tables[0]
+        else:
+            self._fast_mask = None
+            self._fast = None
+        self._find_cache = {}
+        # flat absolute address -> Entry index, insert's common case is one get
+        self._addr_index = {}
+        for br in baseregisters:
+            for baddr in br.baseaddrs:
+                for e in br.entries:
+                    self._addr_index[baddr + e.addr] = e
+        # Bloom-style bitset over the word addresses in the index: 4096 bits,
+        # one test rules out a definite miss before the dict is even hashed
+        self._bf = bytearray(512)
+        for a in self._addr_index:
+            b = (a >> 2) & 0xFFF
+            self._bf[b >> 3] |= 1 << (b & 7)
+        # (addr, fieldname) pairs already inserted: the three sample files
+        # overlap heavily, repeats are rejected before any lookup work
+        self._seen = set()
 
     def insert(self, addr, fieldname, fieldmask):
-        for br in self.baseregisters:
-            if br.abelong(addr):
+        k = (addr, fieldname)
+        if k in self._seen:
+            return False # duplicate of an earlier sample, nothing to update
+        # field masks changed, cached find results may be stale
+        self._find_cache.clear()
+        b = (addr >> 2) & 0xFFF
+        if self._bf[b >> 3] & (1 << (b & 7)):
+            e = self._addr_index.get(addr)
+            if e is not None:
+                e.add_field(fieldname, fieldmask)
+                self._seen.add(k)
+                return True
+        # slow path: per-BaseRegister dispatch, also covers writes at an
+        # address inside a register (a2e_containing) and the error reporting
+        if self._fast is not None:
+            br = self._fast.get(addr & self._fast_mask)
+            if br:
                 br.update_entry_field(addr, fieldname, fieldmask)
+                self._seen.add(k)
+                return True
+            print("Addr", hex(addr), "doesn't belong to any registers!")
+            return False
+        for mask, tbl in self._mask_tables:
+            br = tbl.get(addr & mask)
+            if br:
+                br.update_entry_field(addr, fieldname, fieldmask)
+                self._seen.add(k)
                 return True
         print("Addr", hex(addr), "doesn't belong to any registers!")
         return False
 
+    # batch path for _apply_triples: insert() walks self._* attributes on
+    # every call, here they are hoisted into locals once for the whole batch
+    def bulk_insert(self, triples):
+        self._find_cache.clear()
+        seen = self._seen
+        bf = self._bf
+        idx_get = self._addr_index.get
+        insert = self.insert
+        total = 0
+        unresolved = 0
+        for addr, name, mask in triples:
+            k = (addr, name)
+            if k in seen:
+                unresolved += 1
+                continue
+            b = (addr >> 2) & 0xFFF
+            if bf[b >> 3] & (1 << (b & 7)):
+                e = idx_get(addr)
+                if e is not None:
+                    e.add_field(name, mask)
+                    seen.add(k)
+                    total += 1
+                    continue
+            # rare: containing-address hit or unknown register, take the
+            # full dispatch (and error-reporting) path
+            if insert(addr, name, mask):
+                total += 1
+            else:
+                unresolved += 1
+        return total, unresolved
+
+    # identical triples repeat a lot over a full ps7_init (MIO pins, UARTs...),
+    # so memoize per instance
     def find(self, basereg, entry, field):
+        if not self.inited:
+            genz_zynq7_allregisters_init()
+        key = (basereg, entry, field)
+        try:
+            return self._find_cache[key]
+        except KeyError:
+            pass
+        ret = self._find_impl(basereg, entry, field)
+        self._find_cache[key] = ret
+        return ret
+
+    def _find_impl(self, basereg, entry, field):
         idx = 0
-        if basereg[-1] in ['0', '1']:
-            idx = int(basereg[-1])
+        c = basereg[-1:]
+        if c == '0' or c == '1':
+            idx = ord(c) - 48 # '0' is ASCII 48, no int() call needed
             basereg = basereg[:-1]
         badret = (None, None)
         br = None
+        basereg_lc = basereg.lower() # lowercase the incoming name once
         for _br in self.baseregisters:
-            if basereg.lower() == _br.name.lower():
+            if basereg_lc == _br._name_lc:
                 br = _br
         if br == None:
             print('BaseRegister', basereg, 'not found!')
@@ -145,23 +281,66 @@ class Zynq7_AllRegisters:
         return (addr, mask)
 
     def show(self):
+        if not self.inited:
+            genz_zynq7_allregisters_init()
         for br in self.baseregisters:
             br.show()
 
-def zeros(m):
-    assert m != 0
-    zeros = 0
-    mask0 = m # + (1<<32)
-    while mask0 & 1 == 0:
-        zeros += 1
-        mask0 >>= 1
-    return zeros
-    
+# Output line templates for PS7_InitData.emit, selected once per emit() call
+_TEMPLATES_C = {
+    'poll':      'EMIT_MASKPOLL(0X{:08X}, 0x{:08X}U),\n',
+    'write':     'EMIT_WRITE(0X{:08X}, 0x{:08X}U),\n',
+    'maskwrite': 'EMIT_MASKWRITE(0X{:08X}, 0x{:08X}U, 0x{:08X}U),\n',
+}
+_TEMPLATES_TCL = {
+    'poll':      'mask_poll 0X{:08X} 0x{:08X}\n',
+    'write':     'mwr -force 0X{:08X} 0x{:08X}\n',
+    'maskwrite': 'mask_write 0X{:08X} 0x{:08X} 0x{:08X}\n',
+}
+
+if numba is not None and np is not None:
+    # native-code scan-merge over the SoA columns, writes merged records into
+    # the preallocated out_* arrays and returns the merged length
+    @numba.njit(cache=True)
+    def _merge_cols(addrs, masks, datas, polls, shifts,
+                    out_addrs, out_masks, out_datas, out_polls, out_shifts, out_starts):
+        n = 0
+        for i in range(addrs.shape[0]):
+            shifted = datas[i] << shifts[i]
+            if n > 0 and out_addrs[n-1] == addrs[i] and out_polls[n-1] == polls[i]:
+                out_masks[n-1] |= masks[i]
+                out_datas[n-1] |= shifted
+                # ORed mask keeps the smallest shift of the group
+                if shifts[i] < out_shifts[n-1]:
+                    out_shifts[n-1] = shifts[i]
+            else:
+                out_addrs[n] = addrs[i]
+                out_masks[n] = masks[i]
+                out_datas[n] = shifted
+                out_polls[n] = polls[i]
+                out_shifts[n] = shifts[i]
+                out_starts[n] = i
+                n += 1
+        for j in range(n):
+            out_datas[j] >>= out_shifts[j]
+        return n
+else:
+    _merge_cols = None
+
 class PS7_InitData:
+    __slots__ = ('name', 'addrs', 'masks', 'datas', 'polls', 'shifts', 'comments')
+
     def __init__(self, name=''):
         self.name = name
-        self.emit_list = []
-    
+        # SoA columns: packed 4(1)-byte array slots instead of one record object
+        # per register write
+        self.addrs = array('I')
+        self.masks = array('I')
+        self.datas = array('I')
+        self.polls = array('B')
+        self.shifts = array('B')
+        self.comments = [] # variable length, stays a Python list
+
     # 3 kinds of emit: write(a, d), maskwrite(a, m, d), maskpoll(a, m)
     # other kinds exist, but are not used
     def add(self, z7m, basereg, entry, field, data=0x0, poll=0, fullreg=0):
@@ -169,409 +348,213 @@ class PS7_InitData:
         if addr == None or (mask == None and not fullreg):
             print('Error finding basereg/entry/field from Zynq7_AllRegisters!')
             return False
-        comment = (basereg, entry, field if not fullreg else 'fullreg', data)
-        self.emit_list.append((addr, mask if not fullreg else 0xFFFFFFFF, data, poll, [comment]))
+        # comments never change after add, render both formats right away
+        # instead of in every emit() pass
+        cmt = basereg + ' ' + entry + ' ' + (field if not fullreg else 'fullreg') + ': ' + hex(data)
+        comment = ('// ' + cmt + '\n', 'puts "' + cmt + '"\n')
+        if fullreg:
+            mask = 0xFFFFFFFF
+        self.addrs.append(addr)
+        self.masks.append(mask)
+        self.datas.append(data)
+        self.polls.append(poll)
+        # the field shift never changes, compute it once here
+        # (trailing zero count: isolate the lowest set bit, take its position)
+        self.shifts.append((mask & -mask).bit_length() - 1)
+        self.comments.append([comment])
         return True
 
     # Merge write to the same entry, different field, by ORing all the data/mask
-    # Do not change orders. 
+    # Do not change orders.
+    # This is necessary for at least the UART e0000000 config register
     def merge(self):
-        # shift from e.g. 0xff000000, 0xab to 0xff000000, 0xab000000
-        i=0
-        for addr, mask, data, poll, comment in self.emit_list:
-            self.emit_list[i] = (addr, mask, data << zeros(mask), poll, comment)
-            i+=1
-        # merge entries with same address, this is necessary for 
-        # at least the UART e0000000 config register
-        emit_list_merged = [self.emit_list[0]]
-        for addr, mask, data, poll, comment in self.emit_list[1:]:
-            addr0, mask0, data0, poll0, comments = emit_list_merged[-1]
-            if addr == addr0 and poll == poll0:
-                mask0 |= mask
-                data0 |= data
-                comments += comment
-                emit_list_merged[-1] = (addr0, mask0, data0, poll0, comments)
+        if len(self.addrs) >= 64:
+            # large sequences: jitted/vectorized paths are well worth the setup
+            if _merge_cols is not None:
+                self._merge_numba()
+                return
+            if np is not None:
+                self._merge_np()
+                return
+        # single pass: shift up (e.g. 0xff000000, 0xab to 0xff000000, 0xab000000),
+        # coalesce consecutive same-address runs, shift back at the end
+        addrs = array('I')
+        masks = array('I')
+        datas = array('I') # held in full register position until the shift back
+        polls = array('B')
+        shifts = array('B')
+        comments = []
+        for i in range(len(self.addrs)):
+            addr = self.addrs[i]
+            poll = self.polls[i]
+            shift = self.shifts[i]
+            if addrs and addrs[-1] == addr and polls[-1] == poll:
+                masks[-1] |= self.masks[i]
+                datas[-1] |= self.datas[i] << shift
+                # ORed mask keeps the smallest shift of the group
+                if shift < shifts[-1]:
+                    shifts[-1] = shift
+                comments[-1] += self.comments[i]
             else:
-                emit_list_merged.append((addr, mask, data, poll, comment))
-        self.emit_list = emit_list_merged
-        # for addr, mask, data, poll, comment in self.emit_list:
-            # print('0x%08x, 0x%08x, %08x' % ( addr, mask, data ))
+                addrs.append(addr)
+                masks.append(self.masks[i])
+                datas.append(self.datas[i] << shift)
+                polls.append(poll)
+                shifts.append(shift)
+                comments.append(self.comments[i])
         # shift back to keep consistent with non-merged case
-        i=0
-        for addr, mask, data, poll, comment in self.emit_list:
-            self.emit_list[i] = (addr, mask, data >> zeros(mask), poll, comment)
-            i+=1
+        for i in range(len(datas)):
+            datas[i] >>= shifts[i]
+        self.addrs = addrs
+        self.masks = masks
+        self.datas = datas
+        self.polls = polls
+        self.shifts = shifts
+        self.comments = comments
+
+    # same merge, but runs of identical addresses are reduced with a handful of
+    # C-level ndarray ops instead of a Python per-record loop
+    def _merge_np(self):
+        addrs = np.frombuffer(self.addrs, dtype=np.uint32)
+        polls = np.frombuffer(self.polls, dtype=np.uint8)
+        # int64 so the shifted data can't wrap during the OR
+        masks = np.frombuffer(self.masks, dtype=np.uint32).astype(np.int64)
+        datas = np.frombuffer(self.datas, dtype=np.uint32).astype(np.int64)
+        shifts = np.frombuffer(self.shifts, dtype=np.uint8).astype(np.int64)
+        # a run starts where addr or poll differs from the previous record
+        starts = np.flatnonzero(np.r_[True, (addrs[1:] != addrs[:-1]) | (polls[1:] != polls[:-1])])
+        merged_masks = np.bitwise_or.reduceat(masks, starts)
+        merged_datas = np.bitwise_or.reduceat(datas << shifts, starts)
+        # ORed mask keeps the smallest shift of the group
+        merged_shifts = np.minimum.reduceat(shifts, starts)
+        merged_datas >>= merged_shifts
+        self.addrs = array('I', addrs[starts].tolist())
+        self.masks = array('I', merged_masks.tolist())
+        self.datas = array('I', merged_datas.tolist())
+        self.polls = array('B', polls[starts].tolist())
+        self.shifts = array('B', merged_shifts.tolist())
+        comments = self.comments
+        bounds = starts.tolist() + [len(comments)]
+        self.comments = [sum(comments[bounds[j]:bounds[j+1]], [])
+                         for j in range(len(bounds) - 1)]
+
+    # same merge again, the whole scan runs as numba native code
+    def _merge_numba(self):
+        n_in = len(self.addrs)
+        # int64 working copies so the shifted data can't wrap
+        addrs = np.frombuffer(self.addrs, dtype=np.uint32).astype(np.int64)
+        masks = np.frombuffer(self.masks, dtype=np.uint32).astype(np.int64)
+        datas = np.frombuffer(self.datas, dtype=np.uint32).astype(np.int64)
+        polls = np.frombuffer(self.polls, dtype=np.uint8).astype(np.int64)
+        shifts = np.frombuffer(self.shifts, dtype=np.uint8).astype(np.int64)
+        out_addrs = np.empty(n_in, np.int64)
+        out_masks = np.empty(n_in, np.int64)
+        out_datas = np.empty(n_in, np.int64)
+        out_polls = np.empty(n_in, np.int64)
+        out_shifts = np.empty(n_in, np.int64)
+        out_starts = np.empty(n_in, np.int64)
+        n = _merge_cols(addrs, masks, datas, polls, shifts,
+                        out_addrs, out_masks, out_datas, out_polls, out_shifts, out_starts)
+        self.addrs = array('I', out_addrs[:n].tolist())
+        self.masks = array('I', out_masks[:n].tolist())
+        self.datas = array('I', out_datas[:n].tolist())
+        self.polls = array('B', out_polls[:n].tolist())
+        self.shifts = array('B', out_shifts[:n].tolist())
+        comments = self.comments
+        bounds = out_starts[:n].tolist() + [len(comments)]
+        self.comments = [sum(comments[bounds[j]:bounds[j+1]], [])
+                         for j in range(len(bounds) - 1)]
 
 
     def emit(self, fmt='C', comment=True):
-        e = ''
-        i = 0
-        for addr, mask, data, poll, comments in self.emit_list:
+        # build in a list and join once, += on a str reallocates the whole
+        # output per record
+        parts = []
+        fmt_lc = fmt.lower() # decide the format once, not per record
+        if fmt_lc == 'c':
+            templates = _TEMPLATES_C
+            cmt_idx = 0
+        elif fmt_lc == 'tcl':
+            templates = _TEMPLATES_TCL
+            cmt_idx = 1
+        else:
+            return ''
+        t_poll = templates['poll']
+        t_write = templates['write']
+        t_maskwrite = templates['maskwrite']
+        for i in range(len(self.addrs)):
+            if comment:
+                for cmt in self.comments[i]:
+                    parts.append(cmt[cmt_idx])
+            mask = self.masks[i]
             # shift data to mask position
-            if fmt.lower() == 'c':
-                if comment:
-                    for basereg, entry, field, cmtdata in comments:
-                        e += '// ' + basereg + ' ' + entry + ' ' + field + ': ' + hex(cmtdata) + '\n'
-                if poll:
-                    e += ('EMIT_MASKPOLL(0X%08X, 0x%08XU),\n' % (addr, mask))
-                elif mask == 0xFFFFFFFF:
-                    e += ('EMIT_WRITE(0X%08X, 0x%08XU),\n' % (addr, data << zeros(mask)))
-                else:
-                    e += ('EMIT_MASKWRITE(0X%08X, 0x%08XU, 0x%08XU),\n' % (addr, mask, data << zeros(mask)))
-            elif fmt.lower() == 'tcl':
-                if comment:
-                    for basereg, entry, field, cmtdata in comments:
-                        e += 'puts "' + basereg + ' ' + entry + ' ' + field + ': ' + hex(cmtdata) + '"\n'
-                if poll:
-                    e += ('mask_poll 0X%08X 0x%08X\n' % (addr, mask))
-                elif mask == 0xFFFFFFFF:
-                    e += ('mwr -force 0X%08X 0x%08X\n' % (addr, data << zeros(mask)))
-                else:
-                    e += ('mask_write 0X%08X 0x%08X 0x%08X\n' % (addr, mask, data << zeros(mask)))
-            i += 1
-        return e
+            if self.polls[i]:
+                parts.append(t_poll.format(self.addrs[i], mask))
+            elif mask == 0xFFFFFFFF:
+                parts.append(t_write.format(self.addrs[i], self.datas[i] << self.shifts[i]))
+            else:
+                parts.append(t_maskwrite.format(self.addrs[i], mask, self.datas[i] << self.shifts[i]))
+        return ''.join(parts)
 
 # From UG585, ZYNQ 7000 TRM, Page 1632
 # Register Name, Address, Width, Type, Reset Value, Description
 # Page 832: all base register list
 # periperals like uart, gem, usb, sd, etc has 0 and 1, and address of these are maintained by software.
-slcr = BaseRegister([0xf8000000], [
-    Entry("SCL",0x00000000,32,"rw",0x00000000,"Secure Configuration Lock"),
-    Entry("SLCR_LOCK",0x00000004,32,"wo",0x00000000,"SLCR Write Protection Lock"),
-    Entry("SLCR_UNLOCK",0x00000008,32,"wo",0x00000000,"SLCR Write Protection Unlock"),
-    Entry("SLCR_LOCKSTA",0x0000000C,32,"ro",0x00000001,"SLCR Write Protection Status"),
-    Entry("ARM_PLL_CTRL",0x00000100,32,"rw",0x0001A008,"Arm PLL Control"),
-    Entry("DDR_PLL_CTRL",0x00000104,32,"rw",0x0001A008,"DDR PLL Control"),
-    Entry("IO_PLL_CTRL",0x00000108,32,"rw",0x0001A008,"IO PLL Control"),
-    Entry("PLL_STATUS",0x0000010C,32,"ro",0x0000003F,"PLL Status"),
-    Entry("ARM_PLL_CFG",0x00000110,32,"rw",0x00177EA0,"Arm PLL Configuration"),
-    Entry("DDR_PLL_CFG",0x00000114,32,"rw",0x00177EA0,"DDR PLL Configuration"),
-    Entry("IO_PLL_CFG",0x00000118,32,"rw",0x00177EA0,"IO PLL Configuration"),
-    Entry("ARM_CLK_CTRL",0x00000120,32,"rw",0x1F000400,"CPU Clock Control"),
-    Entry("DDR_CLK_CTRL",0x00000124,32,"rw",0x18400003,"DDR Clock Control"),
-    Entry("DCI_CLK_CTRL",0x00000128,32,"rw",0x01E03201,"DCI clock control"),
-    Entry("APER_CLK_CTRL",0x0000012C,32,"rw",0x01FFCCCD,"AMBA Peripheral Clock Control"),
-    Entry("USB0_CLK_CTRL",0x00000130,32,"rw",0x00101941,"USB 0 ULPI Clock Control"),
-    Entry("USB1_CLK_CTRL",0x00000134,32,"rw",0x00101941,"USB 1 ULPI Clock Control"),
-    Entry("GEM0_RCLK_CTRL",0x00000138,32,"rw",0x00000001,"GigE 0 Rx Clock and Rx Signals Select"),
-    Entry("GEM1_RCLK_CTRL",0x0000013C,32,"rw",0x00000001,"GigE 1 Rx Clock and Rx Signals Select"),
-    Entry("GEM0_CLK_CTRL",0x00000140,32,"rw",0x00003C01,"GigE 0 Ref Clock Control"),
-    Entry("GEM1_CLK_CTRL",0x00000144,32,"rw",0x00003C01,"GigE 1 Ref Clock Control"),
-    Entry("SMC_CLK_CTRL",0x00000148,32,"rw",0x00003C21,"SMC Ref Clock Control"),
-    Entry("LQSPI_CLK_CTRL",0x0000014C,32,"rw",0x00002821,"Quad SPI Ref Clock Control"),
-    Entry("SDIO_CLK_CTRL",0x00000150,32,"rw",0x00001E03,"SDIO Ref Clock Control"),
-    Entry("UART_CLK_CTRL",0x00000154,32,"rw",0x00003F03,"UART Ref Clock Control"),
-    Entry("SPI_CLK_CTRL",0x00000158,32,"rw",0x00003F03,"SPI Ref Clock Control"),
-    Entry("CAN_CLK_CTRL",0x0000015C,32,"rw",0x00501903,"CAN Ref Clock Control"),
-    Entry("CAN_MIOCLK_CTRL",0x00000160,32,"rw",0x00000000,"CAN MIO Clock Control"),
-    Entry("DBG_CLK_CTRL",0x00000164,32,"rw",0x00000F03,"SoC Debug Clock Control"),
-    Entry("PCAP_CLK_CTRL",0x00000168,32,"rw",0x00000F01,"PCAP Clock Control"),
-    Entry("TOPSW_CLK_CTRL",0x0000016C,32,"rw",0x00000000,"Central Interconnect Clock Control"),
-    Entry("FPGA0_CLK_CTRL",0x00000170,32,"rw",0x00101800,"PL Clock 0 Output control"),
-    Entry("FPGA0_THR_CTRL",0x00000174,32,"rw",0x00000000,"PL Clock 0 Throttle control"),
-    Entry("FPGA0_THR_CNT",0x00000178,32,"rw",0x00000000,"PL Clock 0 Throttle Count control"),
-    Entry("FPGA0_THR_STA",0x0000017C,32,"ro",0x00010000,"PL Clock 0 Throttle Status read"),
-    Entry("FPGA1_CLK_CTRL",0x00000180,32,"rw",0x00101800,"PL Clock 1 Output control"),
-    Entry("FPGA1_THR_CTRL",0x00000184,32,"rw",0x00000000,"PL Clock 1 Throttle control"),
-    Entry("FPGA1_THR_CNT",0x00000188,32,"rw",0x00000000,"PL Clock 1 Throttle Count"),
-    Entry("FPGA1_THR_STA",0x0000018C,32,"ro",0x00010000,"PL Clock 1 Throttle Status control"),
-    Entry("FPGA2_CLK_CTRL",0x00000190,32,"rw",0x00101800,"PL Clock 2 output control"),
-    Entry("FPGA2_THR_CTRL",0x00000194,32,"rw",0x00000000,"PL Clock 2 Throttle Control"),
-    Entry("FPGA2_THR_CNT",0x00000198,32,"rw",0x00000000,"PL Clock 2 Throttle Count"),
-    Entry("FPGA2_THR_STA",0x0000019C,32,"ro",0x00010000,"PL Clock 2 Throttle Status"),
-    Entry("FPGA3_CLK_CTRL",0x000001A0,32,"rw",0x00101800,"PL Clock 3 output control"),
-    Entry("FPGA3_THR_CTRL",0x000001A4,32,"rw",0x00000000,"PL Clock 3 Throttle Control"),
-    Entry("FPGA3_THR_CNT",0x000001A8,32,"rw",0x00000000,"PL Clock 3 Throttle Count"),
-    Entry("FPGA3_THR_STA",0x000001AC,32,"ro",0x00010000,"PL Clock 3 Throttle Status"),
-    Entry("CLK_621_TRUE",0x000001C4,32,"rw",0x00000001,"CPU Clock Ratio Mode select"),
-    Entry("PSS_RST_CTRL",0x00000200,32,"rw",0x00000000,"PS Software Reset Control"),
-    Entry("DDR_RST_CTRL",0x00000204,32,"rw",0x00000000,"DDR Software Reset Control"),
-    Entry("TOPSW_RST_CTRL",0x00000208,32,"rw",0x00000000,"Central Interconnect Reset Control"),
-    Entry("DMAC_RST_CTRL",0x0000020C,32,"rw",0x00000000,"DMAC Software Reset Control"),
-    Entry("USB_RST_CTRL",0x00000210,32,"rw",0x00000000,"USB Software Reset Control"),
-    Entry("GEM_RST_CTRL",0x00000214,32,"rw",0x00000000,"Gigabit Ethernet SW Reset Control"),
-    Entry("SDIO_RST_CTRL",0x00000218,32,"rw",0x00000000,"SDIO Software Reset Control"),
-    Entry("SPI_RST_CTRL",0x0000021C,32,"rw",0x00000000,"SPI Software Reset Control"),
-    Entry("CAN_RST_CTRL",0x00000220,32,"rw",0x00000000,"CAN Software Reset Control"),
-    Entry("I2C_RST_CTRL",0x00000224,32,"rw",0x00000000,"I2C Software Reset Control"),
-    Entry("UART_RST_CTRL",0x00000228,32,"rw",0x00000000,"UART Software Reset Control"),
-    Entry("GPIO_RST_CTRL",0x0000022C,32,"rw",0x00000000,"GPIO Software Reset Control"),
-    Entry("LQSPI_RST_CTRL",0x00000230,32,"rw",0x00000000,"Quad SPI Software Reset Control"),
-    Entry("SMC_RST_CTRL",0x00000234,32,"rw",0x00000000,"SMC Software Reset Control"),
-    Entry("OCM_RST_CTRL",0x00000238,32,"rw",0x00000000,"OCM Software Reset Control"),
-    Entry("FPGA_RST_CTRL",0x00000240,32,"rw",0x01F33F0F,"FPGA Software Reset Control"),
-    Entry("A9_CPU_RST_CTRL",0x00000244,32,"rw",0x00000000,"CPU Reset and Clock control"),
-    Entry("RS_AWDT_CTRL",0x0000024C,32,"rw",0x00000000,"Watchdog Timer Reset Control"),
-    Entry("REBOOT_STATUS",0x00000258,32,"rw",0x00400000,"Reboot Status, persistent"),
-    Entry("BOOT_MODE",0x0000025C,32,"mixed","x", "Boot Mode Strapping Pins"),
-    Entry("APU_CTRL",0x00000300,32,"rw",0x00000000,"APU Control"),
-    Entry("WDT_CLK_SEL",0x00000304,32,"rw",0x00000000,"SWDT clock source select"),
-    Entry("TZ_DMA_NS",0x00000440,32,"rw",0x00000000,"DMAC TrustZone Config"),
-    Entry("TZ_DMA_IRQ_NS",0x00000444,32,"rw",0x00000000,"DMAC TrustZone Config for Interrupts"),
-    Entry("TZ_DMA_PERIPH_NS",0x00000448,32,"rw",0x00000000,"DMAC TrustZone Config for Peripherals"),
-    Entry("PSS_IDCODE",0x00000530,32,"ro","x", "PS IDCODE"),
-    Entry("DDR_URGENT",0x00000600,32,"rw",0x00000000,"DDR Urgent Control"),
-    Entry("DDR_CAL_START",0x0000060C,32,"mixed",0x00000000,"DDR Calibration Start Triggers"),
-    Entry("DDR_REF_START",0x00000614,32,"mixed",0x00000000,"DDR Refresh Start Triggers"),
-    Entry("DDR_CMD_STA",0x00000618,32,"mixed",0x00000000,"DDR Command Store Status"),
-    Entry("DDR_URGENT_SEL",0x0000061C,32,"rw",0x00000000,"DDR Urgent Select"),
-    Entry("DDR_DFI_STATUS",0x00000620,32,"mixed",0x00000000,"DDR DFI status"),
-    Entry("MIO_PIN_00",0x00000700,32,"rw",0x00001601,"MIO Pin 0 Control"),
-    Entry("MIO_PIN_01",0x00000704,32,"rw",0x00001601,"MIO Pin 1 Control"),
-    Entry("MIO_PIN_02",0x00000708,32,"rw",0x00000601,"MIO Pin 2 Control"),
-    Entry("MIO_PIN_03",0x0000070C,32,"rw",0x00000601,"MIO Pin 3 Control"),
-    Entry("MIO_PIN_04",0x00000710,32,"rw",0x00000601,"MIO Pin 4 Control"),
-    Entry("MIO_PIN_05",0x00000714,32,"rw",0x00000601,"MIO Pin 5 Control"),
-    Entry("MIO_PIN_06",0x00000718,32,"rw",0x00000601,"MIO Pin 6 Control"),
-    Entry("MIO_PIN_07",0x0000071C,32,"rw",0x00000601,"MIO Pin 7 Control"),
-    Entry("MIO_PIN_08",0x00000720,32,"rw",0x00000601,"MIO Pin 8 Control"),
-    Entry("MIO_PIN_09",0x00000724,32,"rw",0x00001601,"MIO Pin 9 Control"),
-    Entry("MIO_PIN_10",0x00000728,32,"rw",0x00001601,"MIO Pin 10 Control"),
-    Entry("MIO_PIN_11",0x0000072C,32,"rw",0x00001601,"MIO Pin 11 Control"),
-    Entry("MIO_PIN_12",0x00000730,32,"rw",0x00001601,"MIO Pin 12 Control"),
-    Entry("MIO_PIN_13",0x00000734,32,"rw",0x00001601,"MIO Pin 13 Control"),
-    Entry("MIO_PIN_14",0x00000738,32,"rw",0x00001601,"MIO Pin 14 Control"),
-    Entry("MIO_PIN_15",0x0000073C,32,"rw",0x00001601,"MIO Pin 15 Control"),
-    Entry("MIO_PIN_16",0x00000740,32,"rw",0x00001601,"MIO Pin 16 Control"),
-    Entry("MIO_PIN_17",0x00000744,32,"rw",0x00001601,"MIO Pin 17 Control"),
-    Entry("MIO_PIN_18",0x00000748,32,"rw",0x00001601,"MIO Pin 18 Control"),
-    Entry("MIO_PIN_19",0x0000074C,32,"rw",0x00001601,"MIO Pin 19 Control"),
-    Entry("MIO_PIN_20",0x00000750,32,"rw",0x00001601,"MIO Pin 20 Control"),
-    Entry("MIO_PIN_21",0x00000754,32,"rw",0x00001601,"MIO Pin 21 Control"),
-    Entry("MIO_PIN_22",0x00000758,32,"rw",0x00001601,"MIO Pin 22 Control"),
-    Entry("MIO_PIN_23",0x0000075C,32,"rw",0x00001601,"MIO Pin 23 Control"),
-    Entry("MIO_PIN_24",0x00000760,32,"rw",0x00001601,"MIO Pin 24 Control"),
-    Entry("MIO_PIN_25",0x00000764,32,"rw",0x00001601,"MIO Pin 25 Control"),
-    Entry("MIO_PIN_26",0x00000768,32,"rw",0x00001601,"MIO Pin 26 Control"),
-    Entry("MIO_PIN_27",0x0000076C,32,"rw",0x00001601,"MIO Pin 27 Control"),
-    Entry("MIO_PIN_28",0x00000770,32,"rw",0x00001601,"MIO Pin 28 Control"),
-    Entry("MIO_PIN_29",0x00000774,32,"rw",0x00001601,"MIO Pin 29 Control"),
-    Entry("MIO_PIN_30",0x00000778,32,"rw",0x00001601,"MIO Pin 30 Control"),
-    Entry("MIO_PIN_31",0x0000077C,32,"rw",0x00001601,"MIO Pin 31 Control"),
-    Entry("MIO_PIN_32",0x00000780,32,"rw",0x00001601,"MIO Pin 32 Control"),
-    Entry("MIO_PIN_33",0x00000784,32,"rw",0x00001601,"MIO Pin 33 Control"),
-    Entry("MIO_PIN_34",0x00000788,32,"rw",0x00001601,"MIO Pin 34 Control"),
-    Entry("MIO_PIN_35",0x0000078C,32,"rw",0x00001601,"MIO Pin 35 Control"),
-    Entry("MIO_PIN_36",0x00000790,32,"rw",0x00001601,"MIO Pin 36 Control"),
-    Entry("MIO_PIN_37",0x00000794,32,"rw",0x00001601,"MIO Pin 37 Control"),
-    Entry("MIO_PIN_38",0x00000798,32,"rw",0x00001601,"MIO Pin 38 Control"),
-    Entry("MIO_PIN_39",0x0000079C,32,"rw",0x00001601,"MIO Pin 39 Control"),
-    Entry("MIO_PIN_40",0x000007A0,32,"rw",0x00001601,"MIO Pin 40 Control"),
-    Entry("MIO_PIN_41",0x000007A4,32,"rw",0x00001601,"MIO Pin 41 Control"),
-    Entry("MIO_PIN_42",0x000007A8,32,"rw",0x00001601,"MIO Pin 42 Control"),
-    Entry("MIO_PIN_43",0x000007AC,32,"rw",0x00001601,"MIO Pin 43 Control"),
-    Entry("MIO_PIN_44",0x000007B0,32,"rw",0x00001601,"MIO Pin 44 Control"),
-    Entry("MIO_PIN_45",0x000007B4,32,"rw",0x00001601,"MIO Pin 45 Control"),
-    Entry("MIO_PIN_46",0x000007B8,32,"rw",0x00001601,"MIO Pin 46 Control"),
-    Entry("MIO_PIN_47",0x000007BC,32,"rw",0x00001601,"MIO Pin 47 Control"),
-    Entry("MIO_PIN_48",0x000007C0,32,"rw",0x00001601,"MIO Pin 48 Control"),
-    Entry("MIO_PIN_49",0x000007C4,32,"rw",0x00001601,"MIO Pin 49 Control"),
-    Entry("MIO_PIN_50",0x000007C8,32,"rw",0x00001601,"MIO Pin 50 Control"),
-    Entry("MIO_PIN_51",0x000007CC,32,"rw",0x00001601,"MIO Pin 51 Control"),
-    Entry("MIO_PIN_52",0x000007D0,32,"rw",0x00001601,"MIO Pin 52 Control"),
-    Entry("MIO_PIN_53",0x000007D4,32,"rw",0x00001601,"MIO Pin 53 Control"),
-    Entry("MIO_LOOPBACK",0x00000804,32,"rw",0x00000000,"Loopback function within MIO"),
-    Entry("MIO_MST_TRI0",0x0000080C,32,"rw",0xFFFFFFFF,"MIO pin Tri-state Enables, 31:0"),
-    Entry("MIO_MST_TRI1",0x00000810,32,"rw",0x003FFFFF,"MIO pin Tri-state Enables, 53:32"),
-    Entry("SD0_WP_CD_SEL",0x00000830,32,"rw",0x00000000,"SDIO 0 WP CD select"),
-    Entry("SD1_WP_CD_SEL",0x00000834,32,"rw",0x00000000,"SDIO 1 WP CD select"),
-    Entry("LVL_SHFTR_EN",0x00000900,32,"rw",0x00000000,"Level Shifters Enable"),
-    Entry("OCM_CFG",0x00000910,32,"rw",0x00000000,"OCM Address Mapping"),
-    Entry("Reserved",0x00000A1C,32,"rw",0x00010101,"Reserved"),
-    Entry("GPIOB_CTRL",0x00000B00,32,"rw",0x00000000,"PS IO Buffer Control"),
-    Entry("GPIOB_CFG_CMOS18",0x00000B04,32,"rw",0x00000000,"MIO GPIOB CMOS 1.8V config"),
-    Entry("GPIOB_CFG_CMOS25",0x00000B08,32,"rw",0x00000000,"MIO GPIOB CMOS 2.5V config"),
-    Entry("GPIOB_CFG_CMOS33",0x00000B0C,32,"rw",0x00000000,"MIO GPIOB CMOS 3.3V config"),
-    Entry("GPIOB_CFG_HSTL",0x00000B14,32,"rw",0x00000000,"MIO GPIOB HSTL config"),
-    Entry("GPIOB_DRVR_BIAS_CTRL",0x00000B18,32,"mixed",0x00000000,"MIO GPIOB Driver Bias Control"),
-    Entry("DDRIOB_ADDR0",0x00000B40,32,"rw",0x00000800,"DDR IOB Config for ARegister(14:0), CKE and DRST_B"),
-    Entry("DDRIOB_ADDR1",0x00000B44,32,"rw",0x00000800,"DDR IOB Config for BARegister(2:0), ODT, CS_B, WE_B, RAS_B and CAS_B"),
-    Entry("DDRIOB_DATA0",0x00000B48,32,"rw",0x00000800,"DDR IOB Config for Data 15:0"),
-    Entry("DDRIOB_DATA1",0x00000B4C,32,"rw",0x00000800,"DDR IOB Config for Data 31:16"),
-    Entry("DDRIOB_DIFF0",0x00000B50,32,"rw",0x00000800,"DDR IOB Config for DQS 1:0"),
-    Entry("DDRIOB_DIFF1",0x00000B54,32,"rw",0x00000800,"DDR IOB Config for DQS 3:2"),
-    Entry("DDRIOB_CLOCK",0x00000B58,32,"rw",0x00000800,"DDR IOB Config for Clock Output"),
-    Entry("DDRIOB_DRIVE_SLEW_ADDR",0x00000B5C,32,"rw",0x00000000,"Drive and Slew controls for Address and Command pins of the DDR Interface"),
-    Entry("DDRIOB_DRIVE_SLEW_DATA",0x00000B60,32,"rw",0x00000000,"Drive and Slew controls for DQ pins of the DDR Interface"),
-    Entry("DDRIOB_DRIVE_SLEW_DIFF",0x00000B64,32,"rw",0x00000000,"Drive and Slew controls for DQS pins of the DDR Interface"),
-    Entry("DDRIOB_DRIVE_SLEW_CLOCK",0x00000B68,32,"rw",0x00000000,"Drive and Slew controls for Clock pins of the DDR Interface"),
-    Entry("DDRIOB_DDR_CTRL",0x00000B6C,32,"rw",0x00000000,"DDR IOB Buffer Control"),
-    Entry("DDRIOB_DCI_CTRL",0x00000B70,32,"rw",0x00000020,"DDR IOB DCI Config"),
-    Entry("DDRIOB_DCI_STATUS",0x00000B74,32,"mixed",0x00000000,"DDR IO Buffer DCI Status") ], name='slcr')
-ddrc = BaseRegister([0xf8006000], [
-    Entry("ddrc_ctrl", 0x00000000, 32, "rw", 0x00000200, "DDRC Control"),
-    Entry("Two_rank_cfg", 0x00000004, 29, "rw", 0x000C1076, "Two Rank Configuration"),
-    Entry("HPR_reg", 0x00000008, 26, "rw", 0x03C0780F, "HPR Queue control"),
-    Entry("LPR_reg", 0x0000000C, 26, "rw", 0x03C0780F, "LPR Queue control"),
-    Entry("WR_reg", 0x00000010, 26, "rw", 0x0007F80F, "WR Queue control"),
-    Entry("DRAM_param_reg0", 0x00000014, 21, "rw", 0x00041016, "DRAM Parameters 0"),
-    Entry("DRAM_param_reg1", 0x00000018, 32, "rw", 0x351B48D9, "DRAM Parameters 1"),
-    Entry("DRAM_param_reg2", 0x0000001C, 32, "rw", 0x83015904, "DRAM Parameters 2"),
-    Entry("DRAM_param_reg3", 0x00000020, 32, "mixed", 0x250882D0, "DRAM Parameters 3"),
-    Entry("DRAM_param_reg4", 0x00000024, 28, "mixed", 0x0000003C, "DRAM Parameters 4"),
-    Entry("DRAM_init_param", 0x00000028, 14, "rw", 0x00002007, "DRAM Initialization Parameters"),
-    Entry("DRAM_EMR_reg", 0x0000002C, 32, "rw", 0x00000008, "DRAM EMR2, EMR3 access"),
-    Entry("DRAM_EMR_MR_reg", 0x00000030, 32, "rw", 0x00000940, "DRAM EMR, MR access"),
-    Entry("DRAM_burst8_rdwr", 0x00000034, 29, "mixed", 0x00020034, "DRAM Burst 8 read/write"),
-    Entry("DRAM_disable_DQ", 0x00000038, 13, "mixed", 0x00000000, "DRAM Disable DQ"),
-    Entry("DRAM_addr_map_bank", 0x0000003C, 20, "rw", 0x00000F77, "Row/Column address bits"),
-    Entry("DRAM_addr_map_col", 0x00000040, 32, "rw", 0xFFF00000, "Column address bits"),
-    Entry("DRAM_addr_map_row", 0x00000044, 28, "rw", 0x0FF55555, "Select DRAM row address bits"),
-    Entry("DRAM_ODT_reg", 0x00000048, 30, "rw", 0x00000249, "DRAM ODT control"),
-    Entry("phy_dbg_reg", 0x0000004C, 20, "ro", 0x00000000, "PHY debug"),
-    Entry("phy_cmd_timeout_rddata_cpt", 0x00000050, 32, "mixed", 0x00010200, "PHY command time out and read data capture FIFO"),
-    Entry("mode_sts_reg", 0x00000054, 21, "ro", 0x00000000, "Controller operation mode status"),
-    Entry("DLL_calib", 0x00000058, 17, "rw", 0x00000101, "DLL calibration"),
-    Entry("ODT_delay_hold", 0x0000005C, 16, "rw", 0x00000023, "ODT delay and ODT hold"),
-    Entry("ctrl_reg1", 0x00000060, 13, "mixed", 0x0000003E, "Controller 1"),
-    Entry("ctrl_reg2", 0x00000064, 18, "mixed", 0x00020000, "Controller 2"),
-    Entry("ctrl_reg3", 0x00000068, 26, "rw", 0x00284027, "Controller 3"),
-    Entry("ctrl_reg4", 0x0000006C, 16, "rw", 0x00001610, "Controller 4"),
-    Entry("ctrl_reg5", 0x00000078, 32, "mixed", 0x00455111, "Controller register 5"),
-    Entry("ctrl_reg6", 0x0000007C, 32, "mixed", 0x00032222, "Controller register 6"),
-    Entry("CHE_REFRESH_TIMER01", 0x000000A0, 24, "rw", 0x00008000, "CHE_REFRESH_TIMER01"),
-    Entry("CHE_T_ZQ", 0x000000A4, 32, "rw", 0x10300802, "ZQ parameters"),
-    Entry("CHE_T_ZQ_Short_Interval_Reg", 0x000000A8, 28, "rw", 0x0020003A, "Misc parameters"),
-    Entry("deep_pwrdwn_reg", 0x000000AC, 9, "rw", "0x00000000", "Deep powerdown (LPDDR2)"),
-    Entry("reg_2c", 0x000000B0, 29, "mixed", 0x00000000, "Training control"),
-    Entry("reg_2d", 0x000000B4, 11, "rw", 0x00000200, "Misc Debug"),
-    Entry("dfi_timing", 0x000000B8, 25, "rw", 0x00200067, "DFI timing"),
-    Entry("CHE_ECC_CONTROL_REG_OFFSET", 0x000000C4, 2, "rw", 0x00000000 , "ECCerror clear"),
-    Entry("CHE_CORR_ECC_LOG_REG_OFFSET", 0x000000C8, 8, "mixed", 0x00000000 , "ECCerror correction"),
-    Entry("CHE_CORR_ECC_ADDR_REG_OFFSET", 0x000000CC, 31, "ro", 0x00000000, "ECC error correction address log"),
-    Entry("CHE_CORR_ECC_DATA_31_0_REG_OFFSET", 0x000000D0, 32, "ro", 0x00000000, "ECC error correction data log low"),
-    Entry("CHE_CORR_ECC_DATA_63_32_REG_OFFSET", 0x000000D4, 32, "ro", 0x00000000, "ECC error correction data log mid"),
-    Entry("CHE_CORR_ECC_DATA_71_64_REG_OFFSET", 0x000000D8, 8, "ro", 0x00000000, "ECCerror correction data log high"),
-    Entry("CHE_UNCORR_ECC_LOG_REG_OFFSET", 0x000000DC, 1, "clronwr", 0x00000000, "ECC unrecoverable error status"),
-    Entry("CHE_UNCORR_ECC_ADDR_REG_OFFSET", 0x000000E0, 31, "ro", 0x00000000, "ECC unrecoverable error address"),
-    Entry("CHE_UNCORR_ECC_DATA_31_0_REG_OFFSET", 0x000000E4, 32, "ro", 0x00000000, "ECC unrecoverable error data low"),
-    Entry("CHE_UNCORR_ECC_DATA_63_32_REG_OFFSET", 0x000000E8, 32, "ro", 0x00000000, "ECC unrecoverable error data middle"),
-    Entry("CHE_UNCORR_ECC_DATA_71_64_REG_OFFSET", 0x000000EC, 8, "ro", 0x00000000, "ECC unrecoverable error data high"),
-    Entry("CHE_ECC_STATS_REG_OFFSET", 0x000000F0, 16, "clron wr", 0x00000000, "ECC error count"),
-    Entry("ECC_scrub", 0x000000F4, 4, "rw", 0x00000008, "ECC mode/scrub"),
-    Entry("CHE_ECC_CORR_BIT_MASK_31_0_REG_OFFSET", 0x000000F8, 32, "ro", 0x00000000, "ECC data mask low"),
-    Entry("CHE_ECC_CORR_BIT_MASK_63_32_REG_OFFSET", 0x000000FC, 32, "ro", 0x00000000, "ECC data mask high"),
-    Entry("phy_rcvr_enable", 0x00000114, 8, "rw", 0x00000000, "Phyreceiver enable register"),
-    Entry("PHY_Config0", 0x00000118, 31, "rw", 0x40000001, "PHY configuration register for data slice 0."),
-    Entry("PHY_Config1", 0x0000011C, 31, "rw", 0x40000001, "PHY configuration register for data slice 1."),
-    Entry("PHY_Config2", 0x00000120, 31, "rw", 0x40000001, "PHY configuration register for data slice 2."),
-    Entry("PHY_Config3", 0x00000124, 31, "rw", 0x40000001, "PHY configuration register for data slice 3."),
-    Entry("phy_init_ratio0", 0x0000012C, 20, "rw", 0x00000000, "PHY init ratio register for data slice 0."),
-    Entry("phy_init_ratio1", 0x00000130, 20, "rw", 0x00000000, "PHY init ratio register for data slice 1."),
-    Entry("phy_init_ratio2", 0x00000134, 20, "rw", 0x00000000, "PHY init ratio register for data slice 2."),
-    Entry("phy_init_ratio3", 0x00000138, 20, "rw", 0x00000000, "PHY init ratio register for data slice 3."),
-    Entry("phy_rd_dqs_cfg0", 0x00000140, 20, "rw", 0x00000040, "PHY read DQS configuration register for data slice 0."),
-    Entry("phy_rd_dqs_cfg1", 0x00000144, 20, "rw", 0x00000040, "PHY read DQS configuration register for data slice 1."),
-    Entry("phy_rd_dqs_cfg2", 0x00000148, 20, "rw", 0x00000040, "PHY read DQS configuration register for data slice 2."),
-    Entry("phy_rd_dqs_cfg3", 0x0000014C, 20, "rw", 0x00000040, "PHY read DQS configuration register for data slice 3."),
-    Entry("phy_wr_dqs_cfg0", 0x00000154, 20, "rw", 0x00000000, "PHY write DQS configuration register for data slice 0."),
-    Entry("phy_wr_dqs_cfg1", 0x00000158, 20, "rw", 0x00000000, "PHY write DQS configuration register for data slice 1."),
-    Entry("phy_wr_dqs_cfg2", 0x0000015C, 20, "rw", 0x00000000, "PHY write DQS configuration register for data slice 2."),
-    Entry("phy_wr_dqs_cfg3", 0x00000160, 20, "rw", 0x00000000, "PHY write DQS configuration register for data slice 3."),
-    Entry("phy_we_cfg0", 0x00000168, 21, "rw", 0x00000040, "PHY FIFO write enable configuration for data slice 0."),
-    Entry("phy_we_cfg1", 0x0000016C, 21, "rw", 0x00000040, "PHY FIFO write enable configuration for data slice 1."),
-    Entry("phy_we_cfg2", 0x00000170, 21, "rw", 0x00000040, "PHY FIFO write enable configuration for data slice 2."),
-    Entry("phy_we_cfg3", 0x00000174, 21, "rw", 0x00000040, "PHY FIFO write enable configuration for data slice 3."),
-    Entry("wr_data_slv0", 0x0000017C, 20, "rw", 0x00000080, "PHY write data slave ratio config for data slice 0."),
-    Entry("wr_data_slv1", 0x00000180, 20, "rw", 0x00000080, "PHY write data slave ratio config for data slice 1."),
-    Entry("wr_data_slv2", 0x00000184, 20, "rw", 0x00000080, "PHY write data slave ratio config for data slice 2."),
-    Entry("wr_data_slv3", 0x00000188, 20, "rw", 0x00000080, "PHY write data slave ratio config for data slice 3."),
-    Entry("reg_64", 0x00000190, 32, "rw", 0x10020000, "Training control 2"),
-    Entry("reg_65", 0x00000194, 20, "rw", 0x00000000, "Training control 3"),
-    Entry("reg69_6a0", 0x000001A4, 29, "ro", 0x00070000, "Training results for data slice 0."),
-    Entry("reg69_6a1", 0x000001A8, 29, "ro", 0x00060200, "Training results for data slice 1."),
-    Entry("reg6c_6d2", 0x000001B0, 28, "ro", 0x00040600, "Training results for data slice 2."),
-    Entry("reg6c_6d3", 0x000001B4, 28, "ro", 0x00000E00, "Training results for data slice 3."),
-    Entry("reg6e_710", 0x000001B8, 30, "ro", "xx", "Training results (2) for data slice 0."),
-    Entry("reg6e_711", 0x000001BC, 30, "ro", "xx", "Training results (2) for data slice 1."),
-    Entry("reg6e_712", 0x000001C0, 30, "ro", "xx", "Training results (2) for data slice 2."),
-    Entry("reg6e_713", 0x000001C4, 30, "ro", "xx", "Training results (2) for data slice 3."),
-    Entry("phy_dll_sts0", 0x000001CC, 27, "ro", 0x00000000, "Slave DLL results for data slice 0."),
-    Entry("phy_dll_sts1", 0x000001D0, 27, "ro", 0x00000000, "Slave DLL results for data slice 1."),
-    Entry("phy_dll_sts2", 0x000001D4, 27, "ro", 0x00000000, "Slave DLL results for data slice 2."),
-    Entry("phy_dll_sts3", 0x000001D8, 27, "ro", 0x00000000, "Slave DLL results for data slice 3."),
-    Entry("dll_lock_sts", 0x000001E0, 24, "ro", 0x00F00000, "DLL Lock Status, read"),
-    Entry("phy_ctrl_sts", 0x000001E4, 30, "ro", "xx", "PHY Control status, read"),
-    Entry("phy_ctrl_sts_reg2", 0x000001E8, 27, "ro", 0x00000013, "PHY Control status (2), read"),
-    Entry("axi_id", 0x00000200, 26, "ro", 0x00153042, "ID and revision information"),
-    Entry("page_mask", 0x00000204, 32, "rw", 0x00000000, "Page mask"),
-    Entry("axi_priority_wr_port0", 0x00000208, 20, "mixed", 0x000803FF, "AXI Priority control for write port 0."),
-    Entry("axi_priority_wr_port1", 0x0000020C, 20, "mixed", 0x000803FF, "AXI Priority control for write port 1."),
-    Entry("axi_priority_wr_port2", 0x00000210, 20, "mixed", 0x000803FF, "AXI Priority control for write port 2."),
-    Entry("axi_priority_wr_port3", 0x00000214, 20, "mixed", 0x000803FF, "AXI Priority control for write port 3."),
-    Entry("axi_priority_rd_port0", 0x00000218, 20, "mixed", 0x000003FF, "AXI Priority control for read port 0."),
-    Entry("axi_priority_rd_port1", 0x0000021C, 20, "mixed", 0x000003FF, "AXI Priority control for read port 1."),
-    Entry("axi_priority_rd_port2", 0x00000220, 20, "mixed", 0x000003FF, "AXI Priority control for read port 2."),
-    Entry("axi_priority_rd_port3", 0x00000224, 20, "mixed", 0x000003FF, "AXI Priority control for read port 3."),
-    Entry("excl_access_cfg0", 0x00000294, 18, "rw", 0x00000000, "Exclusive access configuration for port 0."),
-    Entry("excl_access_cfg1", 0x00000298, 18, "rw", 0x00000000, "Exclusive access configuration for port 1."),
-    Entry("excl_access_cfg2", 0x0000029C, 18, "rw", 0x00000000, "Exclusive access configuration for port 2."),
-    Entry("excl_access_cfg3", 0x000002A0, 18, "rw", 0x00000000, "Exclusive access configuration for port 3."),
-    Entry("mode_reg_read", 0x000002A4, 32, "ro", 0x00000000, "Mode register read data"),
-    Entry("lpddr_ctrl0", 0x000002A8, 12, "rw", 0x00000000, "LPDDR2 Control 0"),
-    Entry("lpddr_ctrl1", 0x000002AC, 32, "rw", 0x00000000, "LPDDR2 Control 1"),
-    Entry("lpddr_ctrl2", 0x000002B0, 22, "rw", 0x003C0015, "LPDDR2 Control 2"),
-    Entry("lpddr_ctrl3", 0x000002B4, 18, "rw", 0x00000601, "LPDDR2 Control 3")], name='ddrc')
-devcfg = BaseRegister([0xf8007000], [
-    Entry("XDCFG_CTRL_OFFSET", 0x00000000, 32, "mixed", 0x0C006000, "Control Register"),
-    Entry("XDCFG_LOCK_OFFSET", 0x00000004, 32, "mixed", 0x00000000, "Locks for the Control Register."),
-    Entry("XDCFG_CFG_OFFSET", 0x00000008, 32, "rw", 0x00000508, "Configuration Register: This register contains configuration information for the AXI transfers, and other general setup."),
-    Entry("XDCFG_INT_STS_OFFSET", 0x0000000C, 32, "mixed", 0x00000000, "Interrupt Status"),
-    Entry("XDCFG_INT_MASK_OFFSET", 0x00000010, 32, "rw", 0xFFFFFFFF, "Interrupt Mask."),
-    Entry("XDCFG_STATUS_OFFSET", 0x00000014, 32, "mixed", 0x40000820, "Miscellaneous Status."),
-    Entry("XDCFG_DMA_SRC_ADDR_OFFSET", 0x00000018, 32, "rw", 0x00000000, "DMA Source Address."),
-    Entry("XDCFG_DMA_DEST_ADDR_OFFSET", 0x0000001C, 32, "rw", 0x00000000, "DMA Destination Address."),
-    Entry("XDCFG_DMA_SRC_LEN_OFFSET", 0x00000020, 32, "rw", 0x00000000, "DMA Source Transfer Length."),
-    Entry("XDCFG_DMA_DEST_LEN_OFFSET", 0x00000024, 32, "rw", 0x00000000, "DMA Destination Transfer Length."),
-    Entry("XDCFG_MULTIBOOT_ADDR_OFFSET", 0x0000002C, 13, "rw", 0x00000000, "Multi-Boot Address Pointer."),
-    Entry("XDCFG_UNLOCK_OFFSET", 0x00000034, 32, "rw", 0x00000000, "Unlock Control."),
-    Entry("XDCFG_MCTRL_OFFSET", 0x00000080, 32, "mixed", "x", "Miscellaneous Control."),
-    Entry("XADCIF_CFG", 0x00000100, 32, "rw", 0x00001114, "XADC Interface Configuration."),
-    Entry("XADCIF_INT_STS", 0x00000104, 32, "mixed", 0x00000200, "XADC Interface Interrupt Status."),
-    Entry("XADCIF_INT_MASK", 0x00000108, 32, "rw", 0xFFFFFFFF, "XADC Interface Interrupt Mask."),
-    Entry("XADCIF_MSTS", 0x0000010C, 32, "ro", 0x00000500, "XADC Interface Miscellaneous Status."),
-    Entry("XADCIF_CMDFIFO", 0x00000110, 32, "wo", 0x00000000, "XADC Interface Command FIFO Data Port"),
-    Entry("XADCIF_RDFIFO", 0x00000114, 32, "ro", 0x00000000, "XADC Interface Data FIFO Data Port"),
-    Entry("XADCIF_MCTL", 0x00000118, 32, "rw", 0x00000010, "XADC Interface Miscellaneous Control.")], name='devcfg')
-uart = BaseRegister([0xe0000000, 0xe0001000], [
-    Entry("XUARTPS_CR_OFFSET", 0x00000000, 32, "mixed", 0x00000128, "UART Control Register"),
-    Entry("XUARTPS_MR_OFFSET", 0x00000004, 32, "mixed", 0x00000000, "UART Mode Register"),
-    Entry("XUARTPS_IER_OFFSET", 0x00000008, 32, "mixed", 0x00000000, "Interrupt Enable Register"),
-    Entry("XUARTPS_IDR_OFFSET", 0x0000000C, 32, "mixed", 0x00000000, "Interrupt Disable Register"),
-    Entry("XUARTPS_IMR_OFFSET", 0x00000010, 32, "ro", 0x00000000, "Interrupt Mask Register"),
-    Entry("XUARTPS_ISR_OFFSET", 0x00000014, 32, "wtc", 0x00000000, "Channel Interrupt Status Register"),
-    Entry("XUARTPS_BAUDGEN_OFFSET", 0x00000018, 32, "mixed", 0x0000028B, "Baud Rate Generator Register."),
-    Entry("XUARTPS_RXTOUT_OFFSET", 0x0000001C, 32, "mixed", 0x00000000, "Receiver Timeout Register"),
-    Entry("XUARTPS_RXWM_OFFSET", 0x00000020, 32, "mixed", 0x00000020, "Receiver FIFO Trigger Level Register"),
-    Entry("XUARTPS_MODEMCR_OFFSET", 0x00000024, 32, "mixed", 0x00000000, "Modem Control Register"),
-    Entry("XUARTPS_MODEMSR_OFFSET", 0x00000028, 32, "mixed", "x", "Modem Status Register"),
-    Entry("XUARTPS_SR_OFFSET", 0x0000002C, 32, "ro", 0x00000000, "Channel Status Register"),
-    Entry("XUARTPS_FIFO_OFFSET", 0x00000030, 32, "mixed", 0x00000000, "Transmit and Receive FIFO"),
-    Entry("Baud_rate_divider_reg0", 0x00000034, 32, "mixed", 0x0000000F, "Baud Rate Divider Register"),
-    Entry("Flow_delay_reg0", 0x00000038, 32, "mixed", 0x00000000, "Flow Control Delay Register"),
-    Entry("Tx_FIFO_trigger_level0", 0x00000044, 32, "mixed", 0x00000020, "Transmitter FIFO Trigger Level Register")], name='uart')
-qspi = BaseRegister([0xe000d000], [
-	Entry("XQSPIPS_CR_OFFSET", 0x00000000, 32, "mixed", 0x80020000, "QSPI configuration register"),
-	Entry("XQSPIPS_SR_OFFSET", 0x00000004, 32, "mixed", 0x00000004, "QSPI interrupt status register"),
-	Entry("XQSPIPS_IER_OFFSET", 0x00000008, 32, "mixed", 0x00000000, "Interrupt Enable register."),
-	Entry("XQSPIPS_IDR_OFFSET", 0x0000000C, 32, "mixed", 0x00000000, "Interrupt disable register."),
-	Entry("XQSPIPS_IMR_OFFSET", 0x00000010, 32, "ro", 0x00000000, "Interrupt mask register"),
-	Entry("XQSPIPS_ER_OFFSET", 0x00000014, 32, "mixed", 0x00000000, "SPI_Enable Register"),
-	Entry("XQSPIPS_DR_OFFSET", 0x00000018, 32, "rw", 0x00000000, "Delay Register"),
-	Entry("XQSPIPS_TXD_00_OFFSET", 0x0000001C, 32, "wo", 0x00000000, "Transmit Data Register. Keyhole addresses for the Transmit data FIFO. See also TXD1-3."),
-	Entry("XQSPIPS_RXD_OFFSET", 0x00000020, 32, "ro", 0x00000000, "Receive Data Register"),
-	Entry("XQSPIPS_SICR_OFFSET", 0x00000024, 32, "mixed", 0x000000FF, "Slave Idle Count Register"),
-	Entry("XQSPIPS_TXWR_OFFSET", 0x00000028, 32, "rw", 0x00000001, "TX_FIFO Threshold Register"),
-	Entry("RX_thres_REG", 0x0000002C, 32, "rw", 0x00000001, "RX FIFO Threshold Register"),
-	Entry("GPIO", 0x00000030, 32, "rw", 0x00000001, "General Purpose Inputs and Outputs Register for the Quad-SPI Controller core"),
-	Entry("LPBK_DLY_ADJ", 0x00000038, 32, "rw", 0x0000002D, "Loopback Master Clock Delay Adjustment Register"),
-	Entry("XQSPIPS_TXD_01_OFFSET", 0x00000080, 32, "wo", 0x00000000, "Transmit Data Register. Keyhole addresses for the Transmit data FIFO."),
-	Entry("XQSPIPS_TXD_10_OFFSET", 0x00000084, 32, "wo", 0x00000000, "Transmit Data Register. Keyhole addresses for the Transmit data FIFO."),
-	Entry("XQSPIPS_TXD_11_OFFSET", 0x00000088, 32, "wo", 0x00000000, "Transmit Data Register. Keyhole addresses for the Transmit data FIFO."),
-	Entry("XQSPIPS_LQSPI_CR_OFFSET", 0x000000A0, 32, "rw", "x", "Configuration Register specifically for the Linear Quad-SPI Controller"),
-	Entry("XQSPIPS_LQSPI_SR_OFFSET", 0x000000A4, 9, "rw", 0x00000000, "Status Register specifically for the Linear Quad-SPI Controller"),
-	Entry("MOD_ID", 0x000000FC, 32, "rw", 0x01090101, "Module Identification register")], name='qspi')
-sdio = BaseRegister([0xe0100000, 0xe0101000], [], name='sdio')
+# The entry tables live in zynq7000_registers.csv (base,name,offset,width,type,reset,desc):
+# one csv parse pass is much cheaper than executing hundreds of Entry(...) literals at import
+def _load_entry_tables():
+    tables = {}
+    csvpath = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'zynq7000_registers.csv')
+    with open(csvpath, newline='') as f:
+        for base, name, offset, width, tp, reset, desc in csv.reader(f):
+            try:
+                reset = int(reset, 16)
+            except ValueError:
+                pass # a few reset values are unknown ('x', 'xx')
+            tables.setdefault(base, []).append(Entry(name, int(offset, 16), int(width), tp, reset, desc))
+    return tables
+
+# Build the BaseRegister skeleton once per process (functools.cache), and keep a
+# pickle of the built graph in ~/.cache/genz so later imports skip the csv parse
+# and the hundreds of Entry allocations. The cache is keyed on the mtimes of the
+# csv and of this module, so editing either rebuilds it.
+@functools.cache
+def _build_baseregisters():
+    here = os.path.dirname(os.path.abspath(__file__))
+    stamp = (os.path.getmtime(os.path.join(here, 'zynq7000_registers.csv')),
+             os.path.getmtime(os.path.abspath(__file__)))
+    cachepath = os.path.join(os.path.expanduser('~'), '.cache', 'genz', 'baseregs.pkl')
+    try:
+        with open(cachepath, 'rb') as f:
+            cached_stamp, brs = pickle.load(f)
+        if cached_stamp == stamp:
+            return brs
+    except Exception: # missing, stale layout, corrupted... just rebuild
+        pass
+    tables = _load_entry_tables()
+    brs = {
+        'slcr': BaseRegister([0xf8000000], tables['slcr'], name='slcr'),
+        'ddrc': BaseRegister([0xf8006000], tables['ddrc'], name='ddrc'),
+        'devcfg': BaseRegister([0xf8007000], tables['devcfg'], name='devcfg'),
+        'uart': BaseRegister([0xe0000000, 0xe0001000], tables['uart'], name='uart'),
+        'qspi': BaseRegister([0xe000d000], tables['qspi'], name='qspi'),
+        'sdio': BaseRegister([0xe0100000, 0xe0101000], [], name='sdio'),
+    }
+    try:
+        os.makedirs(os.path.dirname(cachepath), exist_ok=True)
+        with open(cachepath, 'wb') as f:
+            pickle.dump((stamp, brs), f)
+    except OSError:
+        pass # read-only home etc, not fatal
+    return brs
+
+_baseregisters = _build_baseregisters()
+slcr = _baseregisters['slcr']
+ddrc = _baseregisters['ddrc']
+devcfg = _baseregisters['devcfg']
+uart = _baseregisters['uart']
+qspi = _baseregisters['qspi']
+sdio = _baseregisters['sdio']
 
 # TODO: make the BaseRegister array findable by name
 zynq7_allregisters = Zynq7_AllRegisters([slcr, devcfg, uart, qspi, sdio])
@@ -582,52 +565,121 @@ zynq7_allregisters = Zynq7_AllRegisters([slcr, devcfg, uart, qspi, sdio])
 # peripherals = PS7_InitData('peripherals')
 # ddr = PS7_InitData('ddr')
 
+# one alternated pattern over the whole buffer: sre stays in C between hits
+# instead of being re-entered once per line. Ordered so a field-name line,
+# its addr line and the MASK line each fire exactly one alternative; the
+# name token can't match the '.. ' indent or the '==>' arrow ([^\s=]+).
+_R_SCAN = re.compile(
+    rb'\.\. (?P<name>[^\s=]+) = [0-9]'
+    rb'|==> (?P<addr>0X[0-9A-F]+)\[[^\]]*\] = 0x[0-9A-F]+U'
+    rb'|==> MASK : (?P<mask>0x[0-9A-F]+)U')
+
+# scan one ps7_init C file for (addr, fieldname, fieldmask) triples
+def _extract_triples(ps7_init):
+    triples = []
+    # everything past the first init data array is useless: let mmap.find
+    # locate the sentinel at memchr speed and only decode the prefix
+    with open(ps7_init, 'rb') as f:
+        mm = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        try:
+            cut = mm.find(b'unsigned long ps7_pll_init_data_2_0')
+            data = mm[:cut if cut >= 0 else len(mm)]
+        finally:
+            mm.close()
+    # single C-level scan of the bytes, the state machine only sees matches:
+    # remember the last field name, pair the next addr with the MASK after it.
+    # Malformed sequences are collected and reported once after the loop: a
+    # broken file shouldn't turn the hot loop into thousands of stdout writes.
+    last_name = None
+    pending_addr = None
+    mask_errs = []
+    # addr/mask tokens repeat constantly (MIO pins, unlock keys...): decode
+    # each distinct token once and look the value up afterwards
+    hexcache = {}
+    for m in _R_SCAN.finditer(data):
+        g = m.lastgroup
+        if g == 'name':
+            last_name = m.group('name').decode()
+        elif g == 'addr':
+            if pending_addr is not None:
+                mask_errs.append(m.start()) # previous addr never got a MASK
+            tok = m.group('addr')
+            v = hexcache.get(tok)
+            if v is None:
+                hexcache[tok] = v = int(tok, 16) # int() takes bytes fine
+            pending_addr = v
+        else:
+            tok = m.group('mask')
+            v = hexcache.get(tok)
+            if v is None:
+                hexcache[tok] = v = int(tok, 16)
+            # a stray MASK with no addr pending is exceptional, let it raise
+            # (None | 0) instead of testing the sequencing state on every hit
+            try:
+                triples.append((pending_addr | 0, last_name, v))
+            except TypeError:
+                continue
+            last_name = None
+            pending_addr = None
+    if pending_addr is not None:
+        mask_errs.append(len(data))
+    # missing names are tallied after the loop rather than branched on per hit
+    noname = sum(1 for t in triples if t[1] is None)
+    if noname:
+        print('Err:', noname, 'addrs without a field name in ps7_init.c!')
+    if mask_errs:
+        print('Err:', len(mask_errs), 'addrs without a MASK in ps7_init.c! (first: line',
+              data.count(b'\n', 0, mask_errs[0]) + 1, ')')
+    return triples
+
+# cached _extract_triples: the triples are deterministic for a given file, so
+# keep them in a sidecar pickle keyed on (size, mtime) and skip the regex pass
+# on warm runs. Pure (no global writes), safe to run from worker threads.
+def _load_triples(ps7_init):
+    st = os.stat(ps7_init)
+    key = (st.st_size, st.st_mtime)
+    try:
+        with open(ps7_init + '.triples.pkl', 'rb') as f:
+            cached_key, triples = pickle.load(f)
+        if cached_key == key:
+            return triples
+    except Exception:
+        pass
+    triples = _extract_triples(ps7_init)
+    try:
+        with open(ps7_init + '.triples.pkl', 'wb') as f:
+            pickle.dump((key, triples), f)
+    except OSError:
+        pass # read-only tree, not fatal
+    return triples
+
+def _apply_triples(triples):
+    entry_total, entry_unresolved = zynq7_allregisters.bulk_insert(triples)
+    print('Total', entry_total, 'entries,', entry_unresolved, 'unresolved. ')
+    return entry_total
+
 def parse_ps7_init_entries_fields(ps7_init):
-    with open(ps7_init, "r") as ps7_init_f:
-        ps7_init_lines = ps7_init_f.readlines()
-
-        ln_cut = 0
-        for ln, l in enumerate(ps7_init_lines):
-            if 'unsigned long ps7_pll_init_data_2_0' in l:
-                ln_cut = ln
-                break
-        ps7_init_lines = ps7_init_lines[:ln_cut]
-
-        entry_unresolved = 0
-        entry_total = 0
-        # print(ps7_init_lines)
-        # print('---')
-        r_entry_addr = re.compile(r'.*==> (0X[0-9A-F]+)\[.*\] = 0x([0-9A-F]+)U')
-        r_field_name = re.compile(r'.*\.\. (.*) = [0-9].*')
-        r_field_mask = re.compile(r'.*==> MASK : (0x[0-9A-F]+)U.*')
-        for ln, l in enumerate(ps7_init_lines):
-            m_entry_addr = r_entry_addr.match(l)
-            if m_entry_addr:
-                m_field_name = r_field_name.match(ps7_init_lines[ln - 1])
-                m_field_mask = r_field_mask.match(ps7_init_lines[ln + 1])
-                if not m_field_name:
-                    print('Err: name syntax incorrect in ps7_init.c!')
-                if not m_field_mask:
-                    print('Err: MASK syntax incorrect in ps7_init.c!')
-                # print(m_entry_addr.group(1), m_field_name.group(1), m_field_mask.group(1))
-                entryaddr = int(m_entry_addr.group(1), 16)
-                fieldname = m_field_name.group(1)
-                fieldmask = int(m_field_mask.group(1), 16)
-                if zynq7_allregisters.insert(entryaddr, fieldname, fieldmask):
-                    entry_total += 1
-                else:
-                    entry_unresolved += 1
-                # break
-        print('Total', entry_total, 'entries,', entry_unresolved, 'unresolved. ')
+    _apply_triples(_load_triples(ps7_init))
 
 def genz_zynq7_allregisters_init(show=False):
     if zynq7_allregisters.inited is False:
-        for sample in ['noddr-0-uart', 'noddr-0-sd', 'noddr-0-uart-elsegpio']:
-            parse_ps7_init_entries_fields(os.path.join(os.path.dirname(os.path.abspath(__file__)), "./tcl_fuzz/hdf/" + sample + "/ps7_init_gpl.c"))
+        zynq7_allregisters.inited = True
+        basedir = os.path.join(os.path.dirname(os.path.abspath(__file__)), "./tcl_fuzz/hdf/")
+        paths = [basedir + sample + "/ps7_init_gpl.c"
+                 for sample in ['noddr-0-uart', 'noddr-0-sd', 'noddr-0-uart-elsegpio']]
+        # extraction is pure, so the three files parse in parallel (the GIL is
+        # dropped during file reads and regex matching); insert stays serial
+        with concurrent.futures.ThreadPoolExecutor(max_workers=3) as pool:
+            for triples in pool.map(_load_triples, paths):
+                if _apply_triples(triples) == 0:
+                    # the samples overlap heavily; once one contributes
+                    # nothing new the remaining ones won't either
+                    break
         if show:
             zynq7_allregisters.show()
 
-genz_zynq7_allregisters_init()
+# field parsing is deferred to the first find()/show(): importing this module
+# just for the register skeleton (slcr/devcfg/... constants) stays cheap
 
 # if __name__ == "__main__":
     # parse_ps7_init_entries_fields("./tcl_fuzz/hdf/noddr-0-uart/ps7_init_gpl.c")